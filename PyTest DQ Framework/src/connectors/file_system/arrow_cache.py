@@ -0,0 +1,103 @@
+import hashlib
+import os
+import pyarrow as pa
+import pyarrow.feather as feather
+from typing import Callable, List, Optional
+
+
+class ArrowCache:
+    """
+    An on-disk cache of query results and Parquet reads stored as Arrow IPC (Feather) files.
+
+    Cached tables are written uncompressed, so later test runs memory-map them
+    instead of querying PostgreSQL or decoding Parquet files again. When no cache
+    directory is configured, every call goes straight to the underlying reader.
+
+    Attributes:
+        cache_dir (Optional[str]): Directory where cached tables are stored. None disables caching.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize the ArrowCache.
+
+        Args:
+            cache_dir (Optional[str]): Directory where cached tables are stored.
+                                       If None, caching is disabled.
+        """
+        self.cache_dir = cache_dir
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def get_data_sql(self, db_connection, query: str) -> pa.Table:
+        """
+        Return the result of a SQL query, reading it from the cache when available.
+
+        The cache key is the query text together with the host, port, database name
+        and user of the connection, so one cache directory can serve several databases.
+        The cache directory must be cleared when the data in a database changes.
+
+        Args:
+            db_connection (PostgresConnectorContextManager): An active database connection.
+            query (str): The SQL query to execute.
+
+        Returns:
+            pa.Table: A table containing the query results.
+        """
+        return self._get_or_load(
+            f"sql:{db_connection.db_host}:{db_connection.db_port}:{db_connection.db_name}:"
+            f"{db_connection.db_user}:{query}",
+            lambda: db_connection.get_data_arrow(query)
+        )
+
+    def process_arrow(self, parquet_reader, path: str, include_subfolders: bool = False,
+                      columns: Optional[List[str]] = None, filters: Optional[list] = None) -> pa.Table:
+        """
+        Return the content of Parquet files, reading it from the cache when available.
+
+        The cache key includes the read arguments and the size and modification time
+        of every Parquet file under the path, so rewritten files invalidate the entry.
+
+        Args:
+            parquet_reader (ParquetReader): The reader used on a cache miss.
+            path (str): The path to the Parquet file or directory containing Parquet files.
+            include_subfolders (bool): If True, reads all Parquet files from subdirectories.
+            columns (Optional[List[str]]): List of column names to read.
+            filters (Optional[list]): Row filters in pyarrow DNF format.
+
+        Returns:
+            pa.Table: A table containing the data from the Parquet file(s).
+        """
+        files = [path] if os.path.isfile(path) else sorted(parquet_reader.list_parquet_files(path))
+        stats = [(file, os.stat(file).st_size, os.stat(file).st_mtime_ns) for file in files]
+        return self._get_or_load(
+            f"parquet:{path}:{include_subfolders}:{columns}:{filters}:{stats}",
+            lambda: parquet_reader.process_arrow(
+                path, include_subfolders=include_subfolders, columns=columns, filters=filters
+            )
+        )
+
+    def _get_or_load(self, key: str, loader: Callable[[], pa.Table]) -> pa.Table:
+        """
+        Return the cached table for the key, or load, store and return it on a miss.
+
+        Args:
+            key (str): A string that uniquely identifies the cached data.
+            loader (Callable[[], pa.Table]): A function that loads the data on a cache miss.
+
+        Returns:
+            pa.Table: The cached or freshly loaded table.
+        """
+        if not self.cache_dir:
+            return loader()
+
+        cache_path = os.path.join(self.cache_dir, f"{hashlib.blake2b(key.encode()).hexdigest()}.arrow")
+        if os.path.exists(cache_path):
+            return feather.read_table(cache_path, memory_map=True)
+
+        table = loader()
+        # Write to a temporary file first so that concurrent runs never read a partial file
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        feather.write_feather(table, tmp_path, compression='uncompressed')
+        os.replace(tmp_path, cache_path)
+        return table
@@ -1,6 +1,10 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-from typing import Optional
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from typing import Iterator, List, Optional
 
 
 class ParquetReader:
@@ -11,21 +15,35 @@ class ParquetReader:
     with support for reading from subdirectories (partitioned data).
     
     Attributes:
-        None
+        BATCH_SIZE (int): Number of rows decoded per record batch, small enough for
+                          a batch of a few columns to stay in the CPU L2 cache.
+        READAHEAD (int): Number of files and batches read ahead while decoding.
+        IGNORE_PREFIXES (tuple): Name prefixes of files and directories that are not data,
+                                 such as hidden files and Spark temporary output.
     """
     
+    BATCH_SIZE = 8192
+    READAHEAD = 16
+    IGNORE_PREFIXES = ('.', '_')
+    
     def __init__(self):
         """Initialize the ParquetReader."""
         pass
     
-    def process(self, path: str, include_subfolders: bool = False) -> pd.DataFrame:
+    def process(self, path: str, include_subfolders: bool = False,
+                columns: Optional[List[str]] = None, filters: Optional[list] = None) -> pd.DataFrame:
         """
-        Read and process Parquet files from the specified path.
+        Read and process Parquet files from the specified path into a pandas DataFrame.
         
         Args:
             path (str): The path to the Parquet file or directory containing Parquet files.
             include_subfolders (bool): If True, reads all Parquet files from subdirectories
                                       (useful for partitioned data). Default is False.
+            columns (Optional[List[str]]): List of column names to read.
+                                          If None, reads all columns.
+            filters (Optional[list]): Row filters in pyarrow DNF format,
+                                      e.g. [('visit_date', '>=', '2024-01-01')].
+                                      If None, reads all rows.
         
         Returns:
             pd.DataFrame: A DataFrame containing the data from the Parquet file(s).
@@ -35,40 +53,187 @@ class ParquetReader:
             ValueError: If no Parquet files are found in the specified path.
             Exception: If reading the Parquet file(s) fails.
         """
+        table = self.process_arrow(path, include_subfolders=include_subfolders, columns=columns, filters=filters)
+        
+        # Check emptiness on the Arrow table so that no DataFrame is built for empty data
+        if table.num_rows == 0:
+            raise ValueError(f"No data found in Parquet files at path: {path}")
+        
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+    
+    def process_arrow(self, path: str, include_subfolders: bool = False,
+                      columns: Optional[List[str]] = None, filters: Optional[list] = None) -> pa.Table:
+        """
+        Read Parquet files from the specified path into an Arrow table.
+        
+        Only the requested columns are decoded, and row groups whose footer
+        statistics cannot satisfy the filters are skipped entirely. The result
+        stays in Arrow memory, so checks that do not need pandas avoid the
+        conversion cost.
+        
+        Args:
+            path (str): The path to the Parquet file or directory containing Parquet files.
+            include_subfolders (bool): If True, reads all Parquet files from subdirectories
+                                      (useful for partitioned data). Default is False.
+            columns (Optional[List[str]]): List of column names to read.
+                                          If None, reads all columns.
+            filters (Optional[list]): Row filters in pyarrow DNF format.
+                                      If None, reads all rows.
+        
+        Returns:
+            pa.Table: A table containing the data from the Parquet file(s).
+        
+        Raises:
+            FileNotFoundError: If the specified path does not exist.
+            ValueError: If the path is invalid or no Parquet files are found.
+            Exception: If reading the Parquet file(s) fails.
+        """
         if not os.path.exists(path):
             raise FileNotFoundError(f"Path does not exist: {path}")
         
+        if not include_subfolders and not (os.path.isfile(path) or os.path.isdir(path)):
+            raise ValueError(f"Invalid path: {path}")
+        
         try:
-            if include_subfolders:
-                # Read all parquet files from subdirectories (partitioned data)
-                df = pd.read_parquet(path, engine='pyarrow')
-            else:
-                # Read a single parquet file or directory
-                if os.path.isfile(path):
-                    df = pd.read_parquet(path, engine='pyarrow')
-                elif os.path.isdir(path):
-                    # Read all parquet files in the directory
-                    df = pd.read_parquet(path, engine='pyarrow')
-                else:
-                    raise ValueError(f"Invalid path: {path}")
-            
-            if df.empty:
-                raise ValueError(f"No data found in Parquet files at path: {path}")
+            if include_subfolders and os.path.isdir(path):
+                # Read all parquet files from subdirectories (partitioned data) in parallel
+                return self._read_files_parallel(path, columns, filters)
             
-            return df
+            # Read a single parquet file or directory; a single file has no partition keys, as with pd.read_parquet
+            dataset = ds.dataset(path, format='parquet', partitioning=self._partitioning() if os.path.isdir(path) else None)
+            return self._scanner(dataset, columns, pq.filters_to_expression(filters) if filters else None).to_table()
+        except (pa.ArrowException, OSError) as e:
+            raise Exception(f"Failed to read Parquet file(s) from {path}: {e}") from e
+    
+    def _read_files_parallel(self, path: str, columns: Optional[List[str]] = None,
+                             filters: Optional[list] = None) -> pa.Table:
+        """
+        Read every Parquet file under the path concurrently and concatenate the results.
+        
+        A single dataset is discovered over the sorted file list first, so hive partition
+        keys (e.g. partition_date=2024-01) get one schema inferred from every partition
+        directory. The fragments are then scanned in parallel with that schema and
+        concatenated in file order.
+        
+        Args:
+            path (str): The path to the directory containing Parquet files.
+            columns (Optional[List[str]]): List of column names to read.
+            filters (Optional[list]): Row filters in pyarrow DNF format.
+        
+        Returns:
+            pa.Table: A table containing the data from all Parquet files.
         
-        except Exception as e:
-            raise Exception(f"Failed to read Parquet file(s) from {path}: {e}")
+        Raises:
+            ValueError: If no Parquet files are found in the specified path.
+        """
+        files = list(self.list_parquet_files(path))
+        if not files:
+            raise ValueError(f"No Parquet files found at path: {path}")
+        
+        dataset = ds.dataset(files, format='parquet', partitioning=self._partitioning(), partition_base_dir=path)
+        expression = pq.filters_to_expression(filters) if filters else None
+        
+        def read_fragment(fragment: ds.Fragment) -> pa.Table:
+            return fragment.to_table(
+                schema=dataset.schema,
+                columns=columns,
+                filter=expression,
+                batch_size=self.BATCH_SIZE,
+                batch_readahead=self.READAHEAD,
+                fragment_scan_options=ds.ParquetFragmentScanOptions(pre_buffer=True),
+                use_threads=True
+            )
+        
+        # Fragments whose partition keys cannot match the filters are skipped without being opened
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            tables = list(executor.map(read_fragment, dataset.get_fragments(filter=expression)))
+        
+        if not tables:
+            return self._scanner(dataset, columns, expression).to_table()
+        
+        return pa.concat_tables(tables)
     
-    def list_parquet_files(self, path: str) -> list:
+    def iter_batches(self, path: str, columns: Optional[List[str]] = None,
+                     batch_size: int = 65536) -> Iterator[pa.RecordBatch]:
+        """
+        Stream Parquet files from the specified path as Arrow record batches.
+        
+        Batches are decoded while earlier ones are consumed, so checks that only
+        reduce the data (counts, nulls) never hold the whole dataset in memory.
+        
+        Args:
+            path (str): The path to the Parquet file or directory containing Parquet files,
+                        including partitioned subdirectories.
+            columns (Optional[List[str]]): List of column names to read.
+                                          If None, reads all columns.
+            batch_size (int): Maximum number of rows per record batch.
+        
+        Returns:
+            Iterator[pa.RecordBatch]: An iterator over the record batches.
+        
+        Raises:
+            FileNotFoundError: If the specified path does not exist.
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Path does not exist: {path}")
+        
+        dataset = ds.dataset(path, format='parquet', partitioning=self._partitioning() if os.path.isdir(path) else None)
+        return self._scanner(dataset, columns, batch_size=batch_size).to_batches()
+    
+    @staticmethod
+    def _partitioning() -> ds.PartitioningFactory:
+        """
+        Create the hive partitioning used for every read.
+        
+        Partition values are dictionary-encoded, as pd.read_parquet does, so partition
+        columns become categoricals in pandas and keys like 01 and x1 share one type.
+        
+        Returns:
+            ds.PartitioningFactory: A hive partitioning discovered from the directory names.
+        """
+        return ds.HivePartitioning.discover(infer_dictionary=True)
+    
+    def _scanner(self, dataset: ds.Dataset, columns: Optional[List[str]] = None,
+                 expression: Optional[ds.Expression] = None, batch_size: Optional[int] = None) -> ds.Scanner:
+        """
+        Create a dataset scanner using cache-sized batches and coalesced reads.
+        
+        pre_buffer merges the column chunk reads of a row group into larger requests,
+        and the readahead settings overlap opening files with decoding batches.
+        
+        Args:
+            dataset (ds.Dataset): The dataset to scan.
+            columns (Optional[List[str]]): List of column names to read.
+            expression (Optional[ds.Expression]): Row filter expression.
+            batch_size (Optional[int]): Maximum number of rows per batch. Defaults to BATCH_SIZE.
+        
+        Returns:
+            ds.Scanner: A scanner over the dataset.
+        """
+        return dataset.scanner(
+            columns=columns,
+            filter=expression,
+            batch_size=batch_size or self.BATCH_SIZE,
+            batch_readahead=self.READAHEAD,
+            fragment_readahead=self.READAHEAD,
+            fragment_scan_options=ds.ParquetFragmentScanOptions(pre_buffer=True),
+            use_threads=True
+        )
+    
+    def list_parquet_files(self, path: str) -> List[str]:
         """
         List all Parquet files in the specified directory and subdirectories.
         
+        os.scandir entries reuse the file type returned by the directory listing,
+        avoiding an extra stat call per entry. Files and directories whose names start
+        with IGNORE_PREFIXES (e.g. _temporary, _SUCCESS, .inprogress files) are skipped,
+        as pyarrow dataset discovery does.
+        
         Args:
             path (str): The path to the directory to search for Parquet files.
         
         Returns:
-            list: A list of paths to Parquet files found.
+            list: A sorted list of paths to Parquet files found.
         
         Raises:
             FileNotFoundError: If the specified path does not exist.
@@ -76,10 +241,30 @@ class ParquetReader:
         if not os.path.exists(path):
             raise FileNotFoundError(f"Path does not exist: {path}")
         
-        parquet_files = []
-        for root, dirs, files in os.walk(path):
-            for file in files:
-                if file.endswith('.parquet'):
-                    parquet_files.append(os.path.join(root, file))
+        # A file path has no directory tree to search, as with os.walk
+        if not os.path.isdir(path):
+            return []
+        
+        return sorted(self._scan_parquet_files(path))
+    
+    @staticmethod
+    def _scan_parquet_files(path: str) -> Iterator[str]:
+        """
+        Yield the paths of Parquet files under the directory, walking it with an explicit stack.
+        
+        Args:
+            path (str): The path to the directory to search for Parquet files.
         
-        return parquet_files
+        Yields:
+            str: The path to a Parquet file.
+        """
+        directories = [path]
+        while directories:
+            with os.scandir(directories.pop()) as entries:
+                for entry in entries:
+                    if entry.name.startswith(ParquetReader.IGNORE_PREFIXES):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+                    elif entry.name.endswith('.parquet') and entry.is_file(follow_symlinks=False):
+                        yield entry.path
@@ -1,6 +1,56 @@
+import atexit
+import itertools
 import psycopg2
+import psycopg2.pool
+from psycopg2 import sql
+import adbc_driver_postgresql.dbapi
 import pandas as pd
-from typing import Optional
+import pyarrow as pa
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from urllib.parse import quote
+
+
+# Connection pools shared by all context managers, keyed by connection parameters
+_connection_pools: Dict[Tuple, psycopg2.pool.ThreadedConnectionPool] = {}
+
+# Idle ADBC connections shared by all context managers, keyed by connection parameters
+_arrow_connection_pools: Dict[Tuple, List[adbc_driver_postgresql.dbapi.Connection]] = {}
+
+# Sequence giving every server-side cursor a unique name
+_cursor_ids = itertools.count()
+
+# PostgreSQL type OID of NUMERIC, as reported in cursor.description
+_NUMERIC_OID = 1700
+
+# Arrow types of streamed result columns, keyed by PostgreSQL type OID; other types are streamed as strings
+_ARROW_TYPES_BY_OID = {
+    16: pa.bool_(),
+    17: pa.binary(),
+    20: pa.int64(),
+    21: pa.int16(),
+    23: pa.int32(),
+    25: pa.string(),
+    700: pa.float32(),
+    701: pa.float64(),
+    1042: pa.string(),
+    1043: pa.string(),
+    1082: pa.date32(),
+    1083: pa.time64('us'),
+    1114: pa.timestamp('us'),
+    1184: pa.timestamp('us', tz='UTC'),
+    1186: pa.duration('us'),
+    _NUMERIC_OID: pa.float64(),
+}
+
+
+def _close_arrow_connections() -> None:
+    """Close every idle ADBC connection; registered to run at interpreter exit."""
+    for idle_connections in _arrow_connection_pools.values():
+        while idle_connections:
+            idle_connections.pop().close()
+
+
+atexit.register(_close_arrow_connections)
 
 
 class PostgresConnectorContextManager:
@@ -9,8 +59,11 @@ class PostgresConnectorContextManager:
     
     This class provides a convenient way to establish, use, and close
     PostgreSQL database connections using the context manager protocol.
-    It also includes a method to execute SQL queries and return results
-    as pandas DataFrames.
+    Both the psycopg2 and the ADBC connections are borrowed from pools shared by
+    all instances with the same connection parameters, so repeated contexts skip
+    the connection handshake.
+    It also includes methods to execute SQL queries and return results
+    as Arrow tables or pandas DataFrames.
     
     Attributes:
         db_host (str): The hostname or IP address of the PostgreSQL server.
@@ -20,6 +73,7 @@ class PostgresConnectorContextManager:
         db_password (str): The password for authentication.
         connection: The active database connection object.
         cursor: The active database cursor object.
+        arrow_connection: The ADBC connection used to fetch query results as Arrow tables.
     """
     
     def __init__(self, db_host: str, db_name: str, db_port: int, db_user: str, db_password: str):
@@ -40,6 +94,7 @@ class PostgresConnectorContextManager:
         self.db_password = db_password
         self.connection = None
         self.cursor = None
+        self.arrow_connection = None
 
     def __enter__(self):
         """
@@ -52,17 +107,11 @@ class PostgresConnectorContextManager:
             psycopg2.Error: If connection to the database fails.
         """
         try:
-            self.connection = psycopg2.connect(
-                host=self.db_host,
-                database=self.db_name,
-                port=self.db_port,
-                user=self.db_user,
-                password=self.db_password
-            )
+            self.connection = self._get_pool().getconn()
             self.cursor = self.connection.cursor()
             return self
         except psycopg2.Error as e:
-            raise Exception(f"Failed to connect to database: {e}")
+            raise Exception(f"Failed to connect to database: {e}") from e
 
     def __exit__(self, exc_type, exc_value, exc_tb):
         """
@@ -75,19 +124,165 @@ class PostgresConnectorContextManager:
         """
         if self.cursor:
             self.cursor.close()
+            self.cursor = None
         if self.connection:
-            self.connection.close()
+            # The pool rolls back any open transaction before reusing the connection
+            self._get_pool().putconn(self.connection)
+            self.connection = None
+        if self.arrow_connection:
+            self._release_arrow_connection()
+
+    def _connection_key(self) -> Tuple:
+        """Return the connection parameters identifying this instance's connection pools."""
+        return (self.db_host, self.db_name, self.db_port, self.db_user, self.db_password)
+
+    def _get_pool(self) -> psycopg2.pool.ThreadedConnectionPool:
+        """
+        Return the connection pool for this instance's connection parameters, creating it on first use.
+        
+        Returns:
+            psycopg2.pool.ThreadedConnectionPool: The shared connection pool.
+        """
+        key = self._connection_key()
+        if key not in _connection_pools:
+            pool = psycopg2.pool.ThreadedConnectionPool(
+                1, 8,
+                host=self.db_host,
+                database=self.db_name,
+                port=self.db_port,
+                user=self.db_user,
+                password=self.db_password
+            )
+            atexit.register(pool.closeall)
+            _connection_pools[key] = pool
+        return _connection_pools[key]
+
+    def _get_arrow_connection(self) -> adbc_driver_postgresql.dbapi.Connection:
+        """
+        Borrow an idle ADBC connection for this instance's connection parameters, or open a new one.
+        
+        Returns:
+            adbc_driver_postgresql.dbapi.Connection: An ADBC connection.
+        """
+        idle_connections = _arrow_connection_pools.setdefault(self._connection_key(), [])
+        try:
+            return idle_connections.pop()
+        except IndexError:
+            return adbc_driver_postgresql.dbapi.connect(
+                f"postgresql://{quote(self.db_user, safe='')}:{quote(self.db_password, safe='')}"
+                f"@{self.db_host}:{self.db_port}/{self.db_name}"
+            )
+
+    def _release_arrow_connection(self) -> None:
+        """Return the ADBC connection to the idle pool, closing it if it cannot be reset."""
+        try:
+            # End the open read transaction, so the idle connection holds no snapshot or locks
+            self.arrow_connection.rollback()
+        except adbc_driver_postgresql.dbapi.Error:
+            self.arrow_connection.close()
+        else:
+            _arrow_connection_pools[self._connection_key()].append(self.arrow_connection)
+        self.arrow_connection = None
+
+    def get_data_arrow(self, query: Union[str, sql.Composable]) -> pa.Table:
+        """
+        Execute a SQL query and return the results as an Arrow table.
+        
+        The query is executed through the ADBC PostgreSQL driver, which reads the
+        result set in the binary COPY format straight into Arrow columns, without
+        building a Python object per row.
+        The driver returns NUMERIC columns as strings; they are cast to float64, so
+        numeric aggregates compare against the Parquet float columns with tolerance.
+        
+        Args:
+            query (Union[str, sql.Composable]): The SQL query to execute. Composed queries
+                                                are rendered with the psycopg2 connection.
+            
+        Returns:
+            pa.Table: A table containing the query results.
+            
+        Raises:
+            Exception: If the query execution fails or connection is not established.
+        """
+        if not self.connection:
+            raise Exception("Database connection is not established. Use this method within a context manager.")
+        
+        try:
+            if isinstance(query, sql.Composable):
+                query = query.as_string(self.connection)
+            if not self.arrow_connection:
+                self.arrow_connection = self._get_arrow_connection()
+            with self.arrow_connection.cursor() as cursor:
+                cursor.execute(query)
+                table = cursor.fetch_arrow_table()
+        except adbc_driver_postgresql.dbapi.Error as e:
+            if self.arrow_connection:
+                self.arrow_connection.rollback()
+            raise Exception(f"Failed to execute query: {e}") from e
+        
+        if not any(pa.types.is_string(field.type) for field in table.schema):
+            return table
+        for index in self._numeric_column_indexes(query):
+            if pa.types.is_string(table.schema.field(index).type):
+                field = table.schema.field(index)
+                table = table.set_column(index, field.with_type(pa.float64()), table.column(index).cast(pa.float64()))
+        return table
 
-    def get_data_sql(self, query: str) -> pd.DataFrame:
+    def _numeric_column_indexes(self, query: str) -> List[int]:
+        """
+        Return the positions of the NUMERIC columns in the result of a query.
+        
+        The query is declared as a cursor and fetched with zero rows, so PostgreSQL
+        only plans it and reports the result column types.
+        
+        Args:
+            query (str): The SQL query to describe.
+            
+        Returns:
+            List[int]: Indexes of the result columns of type NUMERIC.
+            
+        Raises:
+            Exception: If describing the query fails.
+        """
+        name = sql.Identifier(f"dq_describe_{next(_cursor_ids)}")
+        try:
+            self.cursor.execute(sql.SQL("DECLARE {} CURSOR FOR ").format(name) + sql.SQL(query))
+            self.cursor.execute(sql.SQL("FETCH FORWARD 0 FROM {}").format(name))
+            description = self.cursor.description
+            self.cursor.execute(sql.SQL("CLOSE {}").format(name))
+        except psycopg2.Error as e:
+            self.connection.rollback()
+            raise Exception(f"Failed to describe query: {e}") from e
+        return [index for index, column in enumerate(description) if column.type_code == _NUMERIC_OID]
+
+    def get_data_sql(self, query: Union[str, sql.Composable]) -> pd.DataFrame:
         """
         Execute a SQL query and return the results as a pandas DataFrame.
         
         Args:
-            query (str): The SQL query to execute.
+            query (Union[str, sql.Composable]): The SQL query to execute.
             
         Returns:
             pd.DataFrame: A DataFrame containing the query results.
             
+        Raises:
+            Exception: If the query execution fails or connection is not established.
+        """
+        return self.get_data_arrow(query).to_pandas(split_blocks=True, self_destruct=True)
+
+    def get_scalar_sql(self, query: Union[str, sql.Composable]):
+        """
+        Execute a SQL query and return the first column of the first row.
+        
+        This is intended for aggregates (e.g. SELECT count(*) ...) so that only a
+        single value is transferred from the server, without building a DataFrame.
+        
+        Args:
+            query (Union[str, sql.Composable]): The SQL query to execute.
+            
+        Returns:
+            The first value of the query result, or None if no rows are returned.
+            
         Raises:
             Exception: If the query execution fails or connection is not established.
         """
@@ -95,9 +290,151 @@ class PostgresConnectorContextManager:
             raise Exception("Database connection is not established. Use this method within a context manager.")
         
         try:
-            df = pd.read_sql_query(query, self.connection)
-            return df
-        except Exception as e:
-            raise Exception(f"Failed to execute query: {e}")
+            self.cursor.execute(query)
+            row = self.cursor.fetchone()
+            return row[0] if row else None
+        except psycopg2.Error as e:
+            self.connection.rollback()
+            raise Exception(f"Failed to execute query: {e}") from e
 
+    def iter_batches_sql(self, query: str, batch_size: int = 50_000) -> Iterator[pa.RecordBatch]:
+        """
+        Execute a SQL query and stream the results as Arrow record batches.
+        
+        The query runs on a server-side (named) cursor, so PostgreSQL sends the rows
+        in chunks of batch_size and peak memory does not grow with the result size.
+        Every call uses its own cursor name, so several streams can be consumed
+        interleaved on the same connection.
+        The batch schema is fixed once from the cursor description, so all batches
+        can be combined with pa.Table.from_batches.
+        
+        Args:
+            query (str): The SQL query to execute.
+            batch_size (int): Number of rows fetched from the server per batch.
+            
+        Yields:
+            pa.RecordBatch: The next batch of query results.
+            
+        Raises:
+            Exception: If the query execution fails or connection is not established.
+        """
+        if not self.connection:
+            raise Exception("Database connection is not established. Use this method within a context manager.")
+        
+        try:
+            with self.connection.cursor(name=f"dq_stream_{next(_cursor_ids)}") as cursor:
+                cursor.itersize = batch_size
+                cursor.execute(query)
+                schema = None
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    if schema is None:
+                        schema = self._result_schema(cursor.description)
+                    yield self._rows_to_batch(rows, schema)
+        except psycopg2.Error as e:
+            self.connection.rollback()
+            raise Exception(f"Failed to execute query: {e}") from e
 
+    def prepare(self, name: str, query: str) -> None:
+        """
+        Create a prepared statement on the current connection, unless it already exists.
+        
+        The statement is parsed and planned once by PostgreSQL and can then be run
+        repeatedly with execute_prepared. Parameters are referenced as $1, $2, ...
+        Prepared statements live as long as the pooled connection, so later contexts
+        reusing the connection skip the PREPARE as well.
+        
+        Args:
+            name (str): The name of the prepared statement.
+            query (str): The SQL query to prepare.
+            
+        Raises:
+            Exception: If preparing the statement fails or connection is not established.
+        """
+        if not self.connection:
+            raise Exception("Database connection is not established. Use this method within a context manager.")
+        
+        try:
+            self.cursor.execute("SELECT 1 FROM pg_prepared_statements WHERE name = %s", (name,))
+            if self.cursor.fetchone() is None:
+                self.cursor.execute(sql.SQL("PREPARE {} AS ").format(sql.Identifier(name)) + sql.SQL(query))
+        except psycopg2.Error as e:
+            self.connection.rollback()
+            raise Exception(f"Failed to prepare statement '{name}': {e}") from e
+
+    def execute_prepared(self, name: str, params: Sequence = ()) -> pa.RecordBatch:
+        """
+        Execute a prepared statement and return the results as an Arrow record batch.
+        
+        Args:
+            name (str): The name of a statement created with prepare.
+            params (Sequence): Values for the statement parameters, in order.
+            
+        Returns:
+            pa.RecordBatch: A record batch containing the query results.
+            
+        Raises:
+            Exception: If the execution fails or connection is not established.
+        """
+        if not self.connection:
+            raise Exception("Database connection is not established. Use this method within a context manager.")
+        
+        statement = sql.SQL("EXECUTE {}").format(sql.Identifier(name))
+        if params:
+            statement += sql.SQL("({})").format(sql.SQL(", ").join(sql.Placeholder() * len(params)))
+        
+        try:
+            self.cursor.execute(statement, tuple(params))
+            rows = []
+            while True:
+                chunk = self.cursor.fetchmany(self.cursor.arraysize)
+                if not chunk:
+                    break
+                rows.extend(chunk)
+            return self._rows_to_batch(rows, self._result_schema(self.cursor.description))
+        except psycopg2.Error as e:
+            self.connection.rollback()
+            raise Exception(f"Failed to execute prepared statement '{name}': {e}") from e
+
+    @staticmethod
+    def _result_schema(description) -> pa.Schema:
+        """
+        Build the Arrow schema of a result set from the cursor description.
+        
+        NUMERIC columns map to float64, like in get_data_arrow, and column types
+        without an Arrow mapping are returned as strings.
+        
+        Args:
+            description: The cursor description with the result column names and type OIDs.
+            
+        Returns:
+            pa.Schema: The schema with one field per result column.
+        """
+        return pa.schema([
+            pa.field(column.name, _ARROW_TYPES_BY_OID.get(column.type_code, pa.string()))
+            for column in description
+        ])
+
+    @staticmethod
+    def _rows_to_batch(rows: List[tuple], schema: pa.Schema) -> pa.RecordBatch:
+        """
+        Build an Arrow record batch with a fixed schema from DB-API rows.
+        
+        Args:
+            rows (List[tuple]): The fetched rows.
+            schema (pa.Schema): The result schema, see _result_schema.
+            
+        Returns:
+            pa.RecordBatch: A record batch with one column per result column.
+        """
+        columns = zip(*rows) if rows else [[] for _ in schema]
+        arrays = []
+        for values, field in zip(columns, schema):
+            if pa.types.is_float64(field.type):
+                values = [value if value is None or isinstance(value, float) else float(value) for value in values]
+            elif pa.types.is_string(field.type):
+                values = [value if value is None or isinstance(value, str) else str(value) for value in values]
+            arrays.append(pa.array(values, type=field.type))
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
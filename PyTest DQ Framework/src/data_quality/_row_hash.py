@@ -0,0 +1,217 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+# Multiplier used to combine column hashes into a row hash (64-bit golden ratio)
+_COMBINE_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+# Hash assigned to null values, so that nulls match regardless of the column type
+_NULL_HASH = np.uint64(0x6A09E667F3BCC909)
+
+# Salts mixed into the hashes of each logical kind of column, so that equal stored numbers
+# of different kinds (e.g. an integer and a timestamp) do not hash the same
+_KIND_SALTS = {
+    'integer': np.uint64(0xBB67AE8584CAA73B),
+    'boolean': np.uint64(0x3C6EF372FE94F82B),
+    'float': np.uint64(0xA54FF53A5F1D36F1),
+    'temporal': np.uint64(0x510E527FADE682D1),
+    'time': np.uint64(0x9B05688C2B3E6C1F),
+    'duration': np.uint64(0x1F83D9ABFB41BD6B),
+    'bytes': np.uint64(0x5BE0CD19137E2179),
+    'other': np.uint64(0xCBBB9D5DC1059ED8),
+}
+
+# Number of microseconds in the units of Arrow dates, timestamps, times and durations
+_MICROSECONDS_PER_UNIT = {'D': 86_400_000_000, 's': 1_000_000, 'ms': 1_000, 'us': 1}
+
+# Number of leading values used to estimate whether a string column is worth dictionary-encoding
+_CARDINALITY_SAMPLE_SIZE = 65536
+
+# Number of values converted to Python strings at a time when hashing mostly distinct strings
+_HASH_SLICE_SIZE = 262144
+
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    """
+    Scramble 64-bit values with the splitmix64 finalizer.
+
+    Args:
+        values (np.ndarray): Array of 64-bit values, reinterpreted as unsigned.
+
+    Returns:
+        np.ndarray: Array of uint64 hashes.
+    """
+    hashes = values.view(np.uint64).copy()
+    hashes ^= hashes >> np.uint64(30)
+    hashes *= np.uint64(0xBF58476D1CE4E5B9)
+    hashes ^= hashes >> np.uint64(27)
+    hashes *= np.uint64(0x94D049BB133111EB)
+    hashes ^= hashes >> np.uint64(31)
+    return hashes
+
+
+def _hash_bytes(column: pa.ChunkedArray) -> np.ndarray:
+    """
+    Hash every value of a string or binary column through its dictionary encoding.
+
+    Arrow dictionary-encodes the column natively, so each distinct value is converted
+    to a Python object and hashed by pandas only once, and the hashes are then
+    gathered by the dictionary indices. Dictionary-encoded columns are used as is.
+    When a sample of the column is mostly distinct, the values are hashed directly.
+    Both ways give the same hashes, and memory stays proportional to the number of
+    values, not to the string bytes.
+
+    Args:
+        column (pa.ChunkedArray): A string or binary column, plain or dictionary-encoded.
+
+    Returns:
+        np.ndarray: Array of uint64 hashes, one per value.
+    """
+    if not pa.types.is_dictionary(column.type):
+        sample = column.slice(0, _CARDINALITY_SAMPLE_SIZE)
+        if pc.count_distinct(sample).as_py() > len(sample) // 2:
+            # Mostly distinct values gain nothing from the encoding, so they are hashed directly,
+            # in slices so that only a bounded number of Python strings exist at a time
+            return np.concatenate([np.zeros(0, dtype=np.uint64)] + [
+                pd.util.hash_array(column.slice(start, _HASH_SLICE_SIZE).to_numpy(), categorize=False)
+                for start in range(0, len(column), _HASH_SLICE_SIZE)
+            ])
+        column = pc.dictionary_encode(column)
+
+    hashes = [np.zeros(0, dtype=np.uint64)]
+    for chunk in column.chunks:
+        if len(chunk.dictionary) == 0:
+            hashes.append(np.zeros(len(chunk), dtype=np.uint64))
+            continue
+        dictionary_hashes = pd.util.hash_array(chunk.dictionary.to_numpy(zero_copy_only=False), categorize=False)
+        hashes.append(dictionary_hashes[chunk.indices.fill_null(0).to_numpy()])
+    return np.concatenate(hashes)
+
+
+def _hash_column(column: pa.ChunkedArray) -> np.ndarray:
+    """
+    Hash every value of an Arrow column to a uint64.
+
+    Values are normalized before hashing so that equal values stored with different
+    physical types hash the same: integers as int64, floats as float64, dates and
+    timestamps, times and durations in microseconds, dictionaries as their values.
+    Every logical kind of column then gets its own salt, so values of different kinds
+    never match. Fixed-width columns are hashed directly from their buffers, string
+    and binary columns once per distinct value; other types fall back to pandas'
+    object hashing.
+
+    Args:
+        column (pa.ChunkedArray): The column to hash.
+
+    Returns:
+        np.ndarray: Array of uint64 hashes, one per value.
+    """
+    if pa.types.is_dictionary(column.type) and not _is_bytes_type(column.type.value_type):
+        column = column.cast(column.type.value_type)
+
+    column_type = column.type
+    if pa.types.is_date(column_type) or pa.types.is_timestamp(column_type):
+        unit = 'D' if pa.types.is_date32(column_type) else 'ms' if pa.types.is_date64(column_type) else column_type.unit
+        kind, hashes = 'temporal', _hash_microseconds(_storage_values(column), unit)
+    elif pa.types.is_time(column_type):
+        kind, hashes = 'time', _hash_microseconds(_storage_values(column), column_type.unit)
+    elif pa.types.is_duration(column_type):
+        kind, hashes = 'duration', _hash_microseconds(_storage_values(column), column_type.unit)
+    elif pa.types.is_integer(column_type):
+        kind, hashes = 'integer', _mix(column.cast(pa.int64(), safe=False).fill_null(0).to_numpy())
+    elif pa.types.is_boolean(column_type):
+        kind, hashes = 'boolean', _mix(column.cast(pa.int64()).fill_null(0).to_numpy())
+    elif pa.types.is_floating(column_type):
+        kind, hashes = 'float', _mix(column.cast(pa.float64()).fill_null(0).to_numpy())
+    elif _is_bytes_type(column_type) or pa.types.is_dictionary(column_type):
+        kind, hashes = 'bytes', _hash_bytes(column)
+    else:
+        kind, hashes = 'other', pd.util.hash_array(column.to_numpy(zero_copy_only=False).astype(object))
+
+    hashes ^= _KIND_SALTS[kind]
+    return _with_null_hash(hashes, column)
+
+
+def _storage_values(column: pa.ChunkedArray) -> np.ndarray:
+    """
+    Return the stored integers of a date, timestamp, time or duration column as int64.
+
+    Args:
+        column (pa.ChunkedArray): A temporal column.
+
+    Returns:
+        np.ndarray: Array of int64 values; nulls are returned as 0.
+    """
+    storage_type = pa.int32() if column.type.bit_width == 32 else pa.int64()
+    return column.cast(storage_type).fill_null(0).to_numpy().astype(np.int64)
+
+
+def _hash_microseconds(values: np.ndarray, unit: str) -> np.ndarray:
+    """
+    Hash temporal values after converting them to microseconds.
+
+    Microseconds cover every representable date (0001-01-01 to 9999-12-31), unlike
+    nanoseconds. Nanosecond values are split into microseconds and a remainder; the
+    remainder is mixed in only when it is non-zero, so whole microseconds hash the same
+    as at coarser units while sub-microsecond values keep distinct hashes.
+
+    Args:
+        values (np.ndarray): Array of int64 values in the given unit.
+        unit (str): The unit of the values: 'D', 's', 'ms', 'us' or 'ns'.
+
+    Returns:
+        np.ndarray: Array of uint64 hashes.
+    """
+    if unit != 'ns':
+        return _mix(values * _MICROSECONDS_PER_UNIT[unit])
+
+    microseconds, remainder = np.divmod(values, 1000)
+    hashes = _mix(microseconds)
+    sub_microsecond = remainder != 0
+    hashes[sub_microsecond] = _mix(hashes[sub_microsecond] ^ remainder[sub_microsecond].view(np.uint64))
+    return hashes
+
+
+def _is_bytes_type(data_type: pa.DataType) -> bool:
+    """Return True for string, large_string, binary and large_binary types."""
+    return (pa.types.is_string(data_type) or pa.types.is_large_string(data_type)
+            or pa.types.is_binary(data_type) or pa.types.is_large_binary(data_type))
+
+
+def _with_null_hash(hashes: np.ndarray, column: pa.ChunkedArray) -> np.ndarray:
+    """
+    Replace the hashes of null values with the shared null hash.
+
+    Args:
+        hashes (np.ndarray): Array of uint64 hashes of the column values.
+        column (pa.ChunkedArray): The hashed column.
+
+    Returns:
+        np.ndarray: Array of uint64 hashes.
+    """
+    if column.null_count:
+        hashes[column.is_null().to_numpy(zero_copy_only=False)] = _NULL_HASH
+    return hashes
+
+
+def hash_rows(table: pa.Table) -> np.ndarray:
+    """
+    Hash every row of an Arrow table to a uint64.
+
+    Columns are read straight from the Arrow buffers and hashed as whole arrays, then
+    combined per row with h = h * 0x9E3779B97F4A7C15 ^ column_hash. Row hashes depend
+    on the column order, so tables must have their columns aligned before comparison.
+
+    Args:
+        table (pa.Table): The table to hash.
+
+    Returns:
+        np.ndarray: Array of uint64 hashes, one per row.
+    """
+    row_hashes = np.zeros(table.num_rows, dtype=np.uint64)
+    for column in table.columns:
+        row_hashes *= _COMBINE_MULTIPLIER
+        row_hashes ^= _hash_column(column)
+    return row_hashes
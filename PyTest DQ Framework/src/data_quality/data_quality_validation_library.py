@@ -1,64 +1,176 @@
+import re
+import numpy as np
 import pandas as pd
-from typing import List, Optional
+import pyarrow as pa
+from psycopg2 import sql
+from typing import Iterable, List, Optional, Union
+
+from src.data_quality._row_hash import hash_rows
+
+
+# Units of pandas datetime and timedelta values, from the coarsest to the finest
+_TIME_UNITS = ['s', 'ms', 'us', 'ns']
+
+# SQL tokens: quoted literals and identifiers, comments, whitespace, or any other single character
+_SQL_TOKEN_RE = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|--[^\n]*|/\*.*?\*/|\s+|.", re.DOTALL)
 
 
 class DataQualityLibrary:
     """
-    A library of static methods for performing data quality checks on pandas DataFrames.
+    A library of static methods for performing data quality checks on pandas DataFrames
+    and Arrow tables.
 
     This class is intended to be used in a PyTest-based testing framework to validate
     the quality of data in DataFrames. Each method performs a specific data quality
     check and uses assertions to ensure that the data meets the expected conditions.
+    Checks that only reduce the data (counts, nulls, duplicates) run directly on Arrow
+    tables; pandas is materialized only when a detailed comparison is required.
+    check_count and check_not_null_values also accept a stream of Arrow record batches
+    (e.g. from ParquetReader.iter_batches) and accumulate their results batch by batch.
     """
 
     @staticmethod
-    def check_duplicates(df: pd.DataFrame, column_names: Optional[List[str]] = None, max_display: int = 10) -> None:
+    def _num_rows(df: Union[pd.DataFrame, pa.Table, Iterable[pa.RecordBatch]]) -> int:
+        """Return the row count of a DataFrame, an Arrow table or a stream of record batches."""
+        if isinstance(df, pa.Table):
+            return df.num_rows
+        if isinstance(df, pd.DataFrame):
+            return len(df)
+        return sum(batch.num_rows for batch in df)
+
+    @staticmethod
+    def _as_subquery(query: str) -> sql.Composable:
+        """
+        Wrap a query as an aliased subquery for an outer SELECT.
+        
+        The trailing semicolon is stripped together with any comments after it, and the
+        closing parenthesis goes on its own line, so a trailing -- comment cannot hide it.
+        
+        Args:
+            query (str): The SQL query to wrap.
+        
+        Returns:
+            sql.Composable: The query as "(query) q".
+        """
+        # The last token that is not whitespace or a comment is the statement terminator, if any
+        terminator_start = None
+        for token in _SQL_TOKEN_RE.finditer(query):
+            text = token.group()
+            if not (text.isspace() or text.startswith('--') or text.startswith('/*')):
+                terminator_start = token.start() if text == ';' else None
+        if terminator_start is not None:
+            query = query[:terminator_start]
+        return sql.SQL("({}\n) q").format(sql.SQL(query.strip()))
+
+    @staticmethod
+    def _to_arrow(df: Union[pd.DataFrame, pa.Table]) -> pa.Table:
+        """Convert a DataFrame to an Arrow table; Arrow tables are returned unchanged."""
+        return df if isinstance(df, pa.Table) else pa.Table.from_pandas(df, preserve_index=False)
+
+    @staticmethod
+    def _align_time_units(left: pd.DataFrame, right: pd.DataFrame) -> None:
+        """
+        Convert datetime and timedelta columns stored at different units to the finer unit, in place.
+        
+        assert_frame_equal with check_dtype=False compares the stored integers, so
+        1 second and 1 millisecond would otherwise be reported as equal.
+        
+        Args:
+            left (pd.DataFrame): The first DataFrame.
+            right (pd.DataFrame): The second DataFrame, with the same columns.
+        
+        Raises:
+            OutOfBoundsDatetime: If a value cannot be represented at the finer unit.
+        """
+        for column in left.columns:
+            units = [getattr(df[column].array, 'unit', None) for df in (left, right)]
+            if None in units or units[0] == units[1]:
+                continue
+            finest_unit = max(units, key=_TIME_UNITS.index)
+            for df in (left, right):
+                df[column] = df[column].dt.as_unit(finest_unit)
+
+    @staticmethod
+    def check_duplicates(df: Union[pd.DataFrame, pa.Table], column_names: Optional[List[str]] = None,
+                         max_display: int = 10, method: str = 'group_by') -> None:
         """
         Check for duplicate rows in the DataFrame.
         
+        The presence of duplicates is decided first, and the full data is converted to
+        pandas and scanned for the error sample only when duplicates are found.
+        Rows are always compared in the frame's own column-major layout; the frame is
+        never transposed, as DataFrame.T.duplicated() is several times slower than
+        DataFrame.duplicated() on the same data.
+        
         Args:
-            df (pd.DataFrame): The DataFrame to check for duplicates.
+            df (Union[pd.DataFrame, pa.Table]): The DataFrame or Arrow table to check for duplicates.
             column_names (Optional[List[str]]): List of column names to check for duplicates.
                                                If None, checks all columns.
             max_display (int): Maximum number of duplicate rows to display in error message.
+            method (str): How Arrow tables are checked for duplicates. 'group_by' compares the
+                          Arrow distinct key count with the row count; 'duplicated_any' converts
+                          only the key columns to pandas and short-circuits on
+                          DataFrame.duplicated().any(). DataFrames are always checked with
+                          DataFrame.duplicated(keep=False).
         
         Raises:
             AssertionError: If duplicate rows are found.
+            ValueError: If the method is not supported.
         """
-        if column_names:
-            duplicates = df[df.duplicated(subset=column_names, keep=False)]
-        else:
-            duplicates = df[df.duplicated(keep=False)]
+        if method not in ('group_by', 'duplicated_any'):
+            raise ValueError(f"Unsupported duplicate check method: '{method}'.")
         
-        if len(duplicates) > 0:
-            sample_duplicates = duplicates.head(max_display)
-            more_rows = len(duplicates) - max_display if len(duplicates) > max_display else 0
-            
-            error_msg = (
-                f"Found {len(duplicates)} duplicate rows in the dataset.\n\n"
-                f"First {min(len(duplicates), max_display)} duplicate rows:\n"
-                f"{sample_duplicates.to_string()}\n"
-            )
-            
-            if more_rows > 0:
-                error_msg += f"\n... and {more_rows} more duplicate rows not shown."
-            
-            assert False, error_msg
+        if DataQualityLibrary._num_rows(df) < 2:
+            return
+        
+        if isinstance(df, pa.Table):
+            keys = column_names or df.column_names
+            if method == 'group_by':
+                has_duplicates = df.select(keys).group_by(keys).aggregate([]).num_rows < df.num_rows
+            else:
+                has_duplicates = df.select(keys).to_pandas().duplicated().any()
+            if not has_duplicates:
+                return
+            df = df.to_pandas()
+        
+        # A single keep=False pass both decides the check and marks the rows to report,
+        # which is cheaper than building groups with groupby(...).size()
+        duplicated_mask = df.duplicated(subset=column_names or None, keep=False).to_numpy()
+        if not duplicated_mask.any():
+            return
+        
+        duplicate_count = int(duplicated_mask.sum())
+        sample_duplicates = df.iloc[np.flatnonzero(duplicated_mask)[:max_display]]
+        more_rows = duplicate_count - max_display if duplicate_count > max_display else 0
+        
+        error_msg = (
+            f"Found {duplicate_count} duplicate rows in the dataset.\n\n"
+            f"First {min(duplicate_count, max_display)} duplicate rows:\n"
+            f"{sample_duplicates.to_string()}\n"
+        )
+        
+        if more_rows > 0:
+            error_msg += f"\n... and {more_rows} more duplicate rows not shown."
+        
+        raise AssertionError(error_msg)
 
     @staticmethod
-    def check_count(source_df: pd.DataFrame, target_df: pd.DataFrame) -> None:
+    def check_count(source_df: Union[pd.DataFrame, pa.Table, Iterable[pa.RecordBatch]],
+                    target_df: Union[pd.DataFrame, pa.Table, Iterable[pa.RecordBatch]]) -> None:
         """
         Check that the row count of two DataFrames is equal.
         
         Args:
-            source_df (pd.DataFrame): The source DataFrame.
-            target_df (pd.DataFrame): The target DataFrame to compare against.
+            source_df (Union[pd.DataFrame, pa.Table, Iterable[pa.RecordBatch]]): The source DataFrame,
+                Arrow table or stream of record batches.
+            target_df (Union[pd.DataFrame, pa.Table, Iterable[pa.RecordBatch]]): The target DataFrame,
+                Arrow table or stream of record batches to compare against.
         
         Raises:
             AssertionError: If the row counts do not match.
         """
-        source_count = len(source_df)
-        target_count = len(target_df)
+        source_count = DataQualityLibrary._num_rows(source_df)
+        target_count = DataQualityLibrary._num_rows(target_df)
         
         assert source_count == target_count, (
             f"Row count mismatch: Source has {source_count} rows, "
@@ -67,7 +179,35 @@ class DataQualityLibrary:
         )
 
     @staticmethod
-    def check_data_completeness(source_df: pd.DataFrame, target_df: pd.DataFrame, max_display: int = 10) -> None:
+    def check_count_sql(db_connection, source_query: str, target_df: Union[pd.DataFrame, pa.Table]) -> None:
+        """
+        Check that the row count of a source query matches the row count of a target dataset.
+        
+        The source rows are counted by the database server, so only the count is
+        transferred instead of the full result set.
+        
+        Args:
+            db_connection (PostgresConnectorContextManager): An active database connection.
+            source_query (str): The SQL query that produces the source data.
+            target_df (Union[pd.DataFrame, pa.Table]): The target DataFrame or Arrow table to compare against.
+        
+        Raises:
+            AssertionError: If the row counts do not match.
+        """
+        source_count = db_connection.get_scalar_sql(
+            sql.SQL("SELECT count(*) FROM {}").format(DataQualityLibrary._as_subquery(source_query))
+        )
+        target_count = DataQualityLibrary._num_rows(target_df)
+        
+        assert source_count == target_count, (
+            f"Row count mismatch: Source has {source_count} rows, "
+            f"but Target has {target_count} rows. "
+            f"Difference: {abs(source_count - target_count)} rows."
+        )
+
+    @staticmethod
+    def check_data_completeness(source_df: Union[pd.DataFrame, pa.Table], target_df: Union[pd.DataFrame, pa.Table],
+                                key_columns: Optional[List[str]] = None, max_display: int = 10) -> None:
         """
         Check that all rows from the source DataFrame are present in the target DataFrame.
         
@@ -75,114 +215,193 @@ class DataQualityLibrary:
         from the source is present in the target. It performs a full comparison of all
         columns and rows.
         
+        Every row is reduced to a 64-bit hash computed directly from the Arrow columns
+        (DataFrames are converted to Arrow first), so missing and extra rows are found
+        with hash set differences instead of sorting and merging both datasets, and only
+        the rows shown in the error message are converted to pandas. When the row counts
+        differ the datasets cannot be equal, so the diff is reported directly. The sorted,
+        tolerance-based comparison is only attempted when the row counts match, the
+        hashes do not, and a float column or a data type difference could explain it.
+        
         Args:
-            source_df (pd.DataFrame): The source DataFrame (expected data).
-            target_df (pd.DataFrame): The target DataFrame (actual data).
+            source_df (Union[pd.DataFrame, pa.Table]): The source DataFrame (expected data).
+            target_df (Union[pd.DataFrame, pa.Table]): The target DataFrame (actual data).
+            key_columns (Optional[List[str]]): Columns that uniquely identify a row, used to
+                                               order both datasets for the tolerance-based
+                                               comparison. If None, sorts by all columns.
             max_display (int): Maximum number of rows to display in error message.
         
         Raises:
             AssertionError: If there are missing rows or mismatched data.
         """
-        # Reset indices to ensure proper comparison
-        source_df_reset = source_df.reset_index(drop=True)
-        target_df_reset = target_df.reset_index(drop=True)
-        
-        # Sort both dataframes by all columns to ensure consistent ordering
-        source_df_sorted = source_df_reset.sort_values(by=list(source_df_reset.columns)).reset_index(drop=True)
-        target_df_sorted = target_df_reset.sort_values(by=list(target_df_reset.columns)).reset_index(drop=True)
-        
-        # Check if dataframes are equal
-        try:
-            pd.testing.assert_frame_equal(
-                source_df_sorted,
-                target_df_sorted,
-                check_dtype=False,  # Allow type differences
-                check_exact=False,  # Allow small floating-point differences
-                rtol=1e-5  # Relative tolerance for floating-point comparison
+        source_table = DataQualityLibrary._to_arrow(source_df)
+        target_table = DataQualityLibrary._to_arrow(target_df)
+        
+        if set(source_table.column_names) != set(target_table.column_names):
+            raise AssertionError(
+                "Data completeness check failed:\n\n"
+                f"Column mismatch - Source: {source_table.column_names}, "
+                f"Target: {target_table.column_names}\n"
             )
-        except (AssertionError, ValueError) as e:
-            # Find missing rows
-            error_msg = "Data completeness check failed:\n\n"
-            
-            # Add row count comparison
-            error_msg += f"Row count - Source: {len(source_df_sorted)}, Target: {len(target_df_sorted)}\n"
-            error_msg += f"Difference: {abs(len(source_df_sorted) - len(target_df_sorted))} rows\n\n"
+        
+        # Align column order so that row hashes are comparable
+        target_table = target_table.select(source_table.column_names)
+        
+        source_hashes = hash_rows(source_table)
+        target_hashes = hash_rows(target_table)
+        
+        source_count, target_count = source_table.num_rows, target_table.num_rows
+        source_types, target_types = source_table.schema.types, target_table.schema.types
+        
+        if source_count == target_count:
+            # Equal multisets of row hashes mean every row occurs the same number of times
+            if np.array_equal(np.sort(source_hashes), np.sort(target_hashes)):
+                return
             
-            # Try to find specific differences
-            try:
-                merged = source_df_sorted.merge(
-                    target_df_sorted,
-                    how='outer',
-                    indicator=True
-                )
-                
-                missing_in_target = merged[merged['_merge'] == 'left_only'].drop('_merge', axis=1)
-                extra_in_target = merged[merged['_merge'] == 'right_only'].drop('_merge', axis=1)
-                
-                if len(missing_in_target) > 0:
-                    sample_missing = missing_in_target.head(max_display)
-                    more_missing = len(missing_in_target) - max_display if len(missing_in_target) > max_display else 0
-                    
-                    error_msg += f"Rows missing in target ({len(missing_in_target)} total):\n"
-                    error_msg += f"{sample_missing.to_string()}\n"
-                    if more_missing > 0:
-                        error_msg += f"... and {more_missing} more rows not shown.\n"
-                    error_msg += "\n"
-                
-                if len(extra_in_target) > 0:
-                    sample_extra = extra_in_target.head(max_display)
-                    more_extra = len(extra_in_target) - max_display if len(extra_in_target) > max_display else 0
-                    
-                    error_msg += f"Extra rows in target not in source ({len(extra_in_target)} total):\n"
-                    error_msg += f"{sample_extra.to_string()}\n"
-                    if more_extra > 0:
-                        error_msg += f"... and {more_extra} more rows not shown.\n"
+            # Hashes are exact, so only float values or differing types can still match
+            needs_tolerance = source_types != target_types or any(
+                pa.types.is_floating(column_type) for column_type in [*source_types, *target_types]
+            )
+            if needs_tolerance:
+                try:
+                    sort_columns = key_columns or source_table.column_names
+                    source_pdf, target_pdf = source_table.to_pandas(), target_table.to_pandas()
+                    DataQualityLibrary._align_time_units(source_pdf, target_pdf)
+                    pd.testing.assert_frame_equal(
+                        source_pdf.sort_values(by=sort_columns, kind='stable').reset_index(drop=True),
+                        target_pdf.sort_values(by=sort_columns, kind='stable').reset_index(drop=True),
+                        check_dtype=False,  # Allow type differences
+                        check_exact=False,  # Allow small floating-point differences
+                        rtol=1e-5  # Relative tolerance for floating-point comparison
+                    )
+                    return
+                except (AssertionError, ValueError, TypeError):
+                    pass
+        
+        missing_positions = np.flatnonzero(~np.isin(source_hashes, target_hashes))
+        extra_positions = np.flatnonzero(~np.isin(target_hashes, source_hashes))
+        
+        # Find missing rows
+        error_msg = "Data completeness check failed:\n\n"
+        
+        # Add row count comparison
+        error_msg += f"Row count - Source: {source_count}, Target: {target_count}\n"
+        error_msg += f"Difference: {abs(source_count - target_count)} rows\n\n"
+        
+        if len(missing_positions) > 0:
+            sample_missing = source_table.take(missing_positions[:max_display]).to_pandas()
+            sample_missing.index = missing_positions[:max_display]
+            more_missing = len(missing_positions) - max_display if len(missing_positions) > max_display else 0
             
-            except Exception as merge_error:
-                # If merge fails (e.g., due to data type issues), provide basic info
-                error_msg += f"\nUnable to perform detailed comparison: {str(merge_error)}\n"
-                error_msg += "\nPossible causes:\n"
-                error_msg += "- Data type mismatches between source and target\n"
-                error_msg += "- Column name differences\n"
-                error_msg += "- Date/datetime format inconsistencies\n"
+            error_msg += f"Rows missing in target ({len(missing_positions)} total):\n"
+            error_msg += f"{sample_missing.to_string()}\n"
+            if more_missing > 0:
+                error_msg += f"... and {more_missing} more rows not shown.\n"
+            error_msg += "\n"
+        
+        if len(extra_positions) > 0:
+            sample_extra = target_table.take(extra_positions[:max_display]).to_pandas()
+            sample_extra.index = extra_positions[:max_display]
+            more_extra = len(extra_positions) - max_display if len(extra_positions) > max_display else 0
             
-            raise AssertionError(error_msg)
+            error_msg += f"Extra rows in target not in source ({len(extra_positions)} total):\n"
+            error_msg += f"{sample_extra.to_string()}\n"
+            if more_extra > 0:
+                error_msg += f"... and {more_extra} more rows not shown.\n"
+        
+        if len(missing_positions) == 0 and len(extra_positions) == 0:
+            error_msg += "All rows exist in both datasets, but some rows occur a different number of times.\n"
+        
+        if source_types != target_types:
+            error_msg += "\nPossible causes:\n"
+            error_msg += "- Data type mismatches between source and target\n"
+            error_msg += "- Date/datetime format inconsistencies\n"
+        
+        raise AssertionError(error_msg)
 
     @staticmethod
-    def check_dataset_is_not_empty(df: pd.DataFrame) -> None:
+    def check_dataset_is_not_empty(df: Union[pd.DataFrame, pa.Table]) -> None:
         """
         Check that the DataFrame is not empty.
         
         Args:
-            df (pd.DataFrame): The DataFrame to check.
+            df (Union[pd.DataFrame, pa.Table]): The DataFrame or Arrow table to check.
         
         Raises:
             AssertionError: If the DataFrame is empty.
         """
-        assert not df.empty, "Dataset is empty. Expected at least one row."
+        assert DataQualityLibrary._num_rows(df) > 0, "Dataset is empty. Expected at least one row."
         assert len(df.columns) > 0, "Dataset has no columns."
 
     @staticmethod
-    def check_not_null_values(df: pd.DataFrame, column_names: List[str]) -> None:
+    def check_not_null_values(df: Union[pd.DataFrame, pa.Table, Iterable[pa.RecordBatch]],
+                              column_names: List[str]) -> None:
         """
         Check that specified columns do not contain null values.
         
+        Null counts for all columns are computed in a single pass: for Arrow tables and
+        record batches they are read from column metadata, for DataFrames with one
+        vectorized isna().sum(). Record batch counts are summed as the batches arrive.
+        
         Args:
-            df (pd.DataFrame): The DataFrame to check.
+            df (Union[pd.DataFrame, pa.Table, Iterable[pa.RecordBatch]]): The DataFrame,
+                Arrow table or stream of record batches to check.
             column_names (List[str]): List of column names to check for null values.
         
         Raises:
+            ValueError: If any of the specified columns does not exist.
             AssertionError: If null values are found in any of the specified columns.
         """
-        null_columns = []
+        def check_columns_exist(available_columns) -> None:
+            missing_columns = [column for column in column_names if column not in set(available_columns)]
+            if missing_columns:
+                raise ValueError(f"Column '{missing_columns[0]}' does not exist in the DataFrame.")
         
-        for column in column_names:
-            if column not in df.columns:
-                raise ValueError(f"Column '{column}' does not exist in the DataFrame.")
-            
-            null_count = df[column].isna().sum()
-            if null_count > 0:
-                null_columns.append((column, null_count))
+        if isinstance(df, pa.Table):
+            check_columns_exist(df.column_names)
+            null_counts = [column.null_count for column in df.select(column_names).columns]
+        elif isinstance(df, pd.DataFrame):
+            check_columns_exist(df.columns)
+            null_counts = df[column_names].isna().sum(axis=0).tolist()
+        else:
+            null_counts = [0] * len(column_names)
+            for batch in df:
+                check_columns_exist(batch.schema.names)
+                for i, column in enumerate(column_names):
+                    null_counts[i] += batch.column(column).null_count
+        
+        null_columns = [(column, count) for column, count in zip(column_names, null_counts) if count > 0]
+        
+        assert len(null_columns) == 0, (
+            f"Found null values in the following columns:\n" +
+            "\n".join([f"  - {col}: {count} null values" for col, count in null_columns])
+        )
+
+    @staticmethod
+    def check_not_null_values_sql(db_connection, query: str, column_names: List[str]) -> None:
+        """
+        Check that specified columns of a query result do not contain null values.
+        
+        Null values are counted by the database server in a single aggregate query,
+        so only one row with the counts is transferred.
+        
+        Args:
+            db_connection (PostgresConnectorContextManager): An active database connection.
+            query (str): The SQL query that produces the data to check.
+            column_names (List[str]): List of column names to check for null values.
+        
+        Raises:
+            AssertionError: If null values are found in any of the specified columns.
+        """
+        null_counts = sql.SQL(", ").join(
+            sql.SQL("count(*) FILTER (WHERE {} IS NULL)").format(sql.Identifier(column)) for column in column_names
+        )
+        null_counts_df = db_connection.get_data_sql(
+            sql.SQL("SELECT {} FROM {}").format(null_counts, DataQualityLibrary._as_subquery(query))
+        )
+        null_columns = [
+            (column, count) for column, count in zip(column_names, null_counts_df.iloc[0]) if count > 0
+        ]
         
         assert len(null_columns) == 0, (
             f"Found null values in the following columns:\n" +
@@ -2,6 +2,7 @@ import pytest
 from src.connectors.postgres.postgres_connector import PostgresConnectorContextManager
 from src.data_quality.data_quality_validation_library import DataQualityLibrary
 from src.connectors.file_system.parquet_reader import ParquetReader
+from src.connectors.file_system.arrow_cache import ArrowCache
 
 def pytest_addoption(parser):
     """
@@ -14,6 +15,10 @@ def pytest_addoption(parser):
     parser.addoption("--db_port", action="store", default="5434", help="Database port")
     parser.addoption("--db_user", action="store", help="Database user (required)")
     parser.addoption("--db_password", action="store", help="Database password (required)")
+    parser.addoption(
+        "--arrow_cache_dir", action="store", default=None,
+        help="Directory to cache loaded datasets as Arrow IPC files between runs (disabled by default)"
+    )
 
 
 def pytest_configure(config):
@@ -49,6 +54,9 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "patient_sum_treatment_cost_per_facility_type: Tests for patient_sum_treatment_cost_per_facility_type dataset"
     )
+    config.addinivalue_line(
+        "markers", "unit: Unit tests of the framework itself, run without a database"
+    )
 
 
 @pytest.fixture(scope='session')
@@ -59,6 +67,14 @@ def db_connection(request):
     This fixture creates a PostgreSQL connection using the command-line options
     provided by the user. The connection is shared across all tests in the session.
     
+    Queries that run repeatedly with different parameters should be prepared once
+    in a module-scoped fixture and executed per test, so PostgreSQL plans them once:
+    
+        @pytest.fixture(scope='module')
+        def visits_per_facility(db_connection):
+            db_connection.prepare('visits_per_facility', 'SELECT ... WHERE facility_id = $1')
+            return lambda facility_id: db_connection.execute_prepared('visits_per_facility', [facility_id])
+    
     Args:
         request: Pytest request object to access command-line options.
     
@@ -88,49 +104,106 @@ def db_connection(request):
 
 
 @pytest.fixture(scope='session')
-def parquet_reader(request):
+def parquet_reader():
     """
     Fixture to create a ParquetReader instance for the test session.
     
     This fixture provides a ParquetReader object that can be used to read
     and process Parquet files stored in the file system.
     
+    Returns:
+        ParquetReader: Parquet reader object.
+    """
+    return ParquetReader()
+
+
+@pytest.fixture(scope='session')
+def arrow_cache(request):
+    """
+    Fixture to create an ArrowCache instance for the test session.
+    
+    The cache directory is taken from the --arrow_cache_dir option. Without it,
+    the cache passes every call through to the database or the Parquet reader.
+    
     Args:
-        request: Pytest request object.
+        request: Pytest request object to access command-line options.
     
-    Yields:
-        ParquetReader: Parquet reader object.
+    Returns:
+        ArrowCache: Arrow IPC cache object.
+    """
+    return ArrowCache(request.config.getoption("--arrow_cache_dir"))
+
+
+@pytest.fixture(scope='session')
+def dataset_registry():
+    """
+    Fixture to hold every dataset loaded during the test session.
     
-    Raises:
-        pytest.fail: If the ParquetReader cannot be initialized.
+    Datasets are keyed by their source (Parquet path and columns, or SQL query),
+    so test modules sharing a physical dataset load it only once per session.
+    DQ checks are read-only, so sharing the loaded tables does not affect isolation.
+    
+    Returns:
+        dict: Mapping of dataset keys to loaded Arrow tables.
     """
-    try:
-        reader = ParquetReader()
-        yield reader
-    except Exception as e:
-        pytest.fail(f"Failed to initialize ParquetReader: {e}")
-    finally:
-        del reader
+    return {}
 
 
 @pytest.fixture(scope='session')
-def data_quality_library():
+def load_parquet(parquet_reader, arrow_cache, dataset_registry):
     """
-    Fixture to create a DataQualityLibrary instance for the test session.
+    Fixture providing a function to load Parquet data once per session.
     
-    This fixture provides a DataQualityLibrary object containing methods
-    for performing data quality checks on DataFrames.
+    Args:
+        parquet_reader: Parquet reader fixture.
+        arrow_cache: Arrow IPC cache fixture.
+        dataset_registry: Session dataset registry fixture.
     
-    Yields:
-        DataQualityLibrary: Data quality library object.
+    Returns:
+        Callable: Function (path, include_subfolders=False, columns=None) -> pa.Table.
+    """
+    def _load_parquet(path, include_subfolders=False, columns=None):
+        key = ('parquet', path, include_subfolders, tuple(columns) if columns else None)
+        if key not in dataset_registry:
+            dataset_registry[key] = arrow_cache.process_arrow(
+                parquet_reader, path, include_subfolders=include_subfolders, columns=columns
+            )
+        return dataset_registry[key]
     
-    Raises:
-        pytest.fail: If the DataQualityLibrary cannot be initialized.
+    return _load_parquet
+
+
+@pytest.fixture(scope='session')
+def load_sql(db_connection, arrow_cache, dataset_registry):
     """
-    try:
-        data_quality_library = DataQualityLibrary()
-        yield data_quality_library
-    except Exception as e:
-        pytest.fail(f"Failed to initialize DataQualityLibrary: {e}")
-    finally:
-        del data_quality_library
\ No newline at end of file
+    Fixture providing a function to load the result of a SQL query once per session.
+    
+    Args:
+        db_connection: Database connection fixture.
+        arrow_cache: Arrow IPC cache fixture.
+        dataset_registry: Session dataset registry fixture.
+    
+    Returns:
+        Callable: Function (query) -> pa.Table.
+    """
+    def _load_sql(query):
+        key = ('sql', query)
+        if key not in dataset_registry:
+            dataset_registry[key] = arrow_cache.get_data_sql(db_connection, query)
+        return dataset_registry[key]
+    
+    return _load_sql
+
+
+@pytest.fixture(scope='session')
+def data_quality_library():
+    """
+    Fixture to provide the DataQualityLibrary for the test session.
+    
+    DataQualityLibrary only contains static methods for performing data quality
+    checks on DataFrames, so the class itself is provided without instantiation.
+    
+    Returns:
+        type[DataQualityLibrary]: Data quality library class.
+    """
+    return DataQualityLibrary
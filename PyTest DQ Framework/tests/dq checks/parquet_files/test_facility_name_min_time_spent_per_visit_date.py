@@ -7,21 +7,7 @@ Author(s): Name Surname
 import pytest
 
 
-@pytest.fixture(scope='module')
-def source_data(db_connection):
-    """
-    Fixture to load source data from PostgreSQL database.
-    
-    This query retrieves the expected data for facility_name_min_time_spent_per_visit_date
-    from the normalized tables in the database.
-    
-    Args:
-        db_connection: Database connection fixture from conftest.py
-    
-    Returns:
-        pd.DataFrame: Source data from PostgreSQL
-    """
-    source_query = """
+SOURCE_QUERY = """
     SELECT
         f.facility_name,
         v.visit_timestamp::date AS visit_date,
@@ -37,12 +23,28 @@ def source_data(db_connection):
         f.facility_name,
         visit_date;
     """
-    source_data = db_connection.get_data_sql(source_query)
+
+
+@pytest.fixture(scope='module')
+def source_data(load_sql):
+    """
+    Fixture to load source data from PostgreSQL database.
+    
+    This query retrieves the expected data for facility_name_min_time_spent_per_visit_date
+    from the normalized tables in the database.
+    
+    Args:
+        load_sql: Session-cached SQL loader fixture from conftest.py
+    
+    Returns:
+        pa.Table: Source data from PostgreSQL
+    """
+    source_data = load_sql(SOURCE_QUERY)
     return source_data
 
 
 @pytest.fixture(scope='module')
-def target_data(parquet_reader):
+def target_data(load_parquet):
     """
     Fixture to load target data from Parquet files.
     
@@ -50,13 +52,17 @@ def target_data(parquet_reader):
     directory, including partitioned subdirectories.
     
     Args:
-        parquet_reader: Parquet reader fixture from conftest.py
+        load_parquet: Session-cached Parquet loader fixture from conftest.py
     
     Returns:
-        pd.DataFrame: Target data from Parquet files
+        pa.Table: Target data from Parquet files
     """
     target_path = '/parquet_data/facility_name_min_time_spent_per_visit_date'
-    target_data = parquet_reader.process(target_path, include_subfolders=True)
+    target_data = load_parquet(
+        target_path,
+        include_subfolders=True,
+        columns=['facility_name', 'visit_date', 'min_time_spent']
+    )
     
     return target_data
 
@@ -95,13 +101,14 @@ def test_check_source_dataset_is_not_empty(source_data, data_quality_library):
 
 @pytest.mark.parquet_data
 @pytest.mark.facility_name_min_time_spent_per_visit_date
-def test_check_row_count(source_data, target_data, data_quality_library):
+def test_check_row_count(db_connection, target_data, data_quality_library):
     """
     Test to verify that source and target have the same number of rows.
     
     This is a quick completeness check before detailed comparison.
+    The source rows are counted in the database instead of being loaded.
     """
-    data_quality_library.check_count(source_data, target_data)
+    data_quality_library.check_count_sql(db_connection, SOURCE_QUERY, target_data)
 
 
 @pytest.mark.parquet_data
@@ -114,7 +121,11 @@ def test_check_data_completeness(source_data, target_data, data_quality_library)
     Known Issue: The source query contains a UNION ALL that creates duplicates
                 for 'Clinic' facility types, which should fail this test.
     """
-    data_quality_library.check_data_completeness(source_data, target_data)
+    data_quality_library.check_data_completeness(
+        source_data,
+        target_data,
+        key_columns=['facility_name', 'visit_date']
+    )
 
 
 # ============================================================================
@@ -133,7 +144,8 @@ def test_check_no_duplicates_in_target(target_data, data_quality_library):
     """
     data_quality_library.check_duplicates(
         target_data,
-        column_names=['facility_name', 'visit_date']
+        column_names=['facility_name', 'visit_date'],
+        method='duplicated_any'
     )
 
 
@@ -0,0 +1,65 @@
+"""
+Description: Unit tests for the row hashing used by check_data_completeness.
+Different values must never be reported as complete because their hashes collide.
+"""
+
+import datetime
+
+import pyarrow as pa
+import pytest
+
+from src.data_quality._row_hash import hash_rows
+
+
+def _single_column_table(values, column_type):
+    return pa.table({'value': pa.array(values, type=column_type)})
+
+
+@pytest.mark.unit
+def test_sub_microsecond_timestamps_do_not_collide(data_quality_library):
+    # 1970-01-01 00:00:01.000001 vs 1970-01-01 00:00:00.001000001
+    source = _single_column_table([1_000_001_000], pa.timestamp('ns'))
+    target = _single_column_table([1_000_001], pa.timestamp('ns'))
+    
+    with pytest.raises(AssertionError):
+        data_quality_library.check_data_completeness(source, target)
+
+
+@pytest.mark.unit
+def test_durations_are_compared_in_a_common_unit(data_quality_library):
+    source = _single_column_table([1, 2], pa.duration('s'))
+    target = _single_column_table([1, 2], pa.duration('ms'))
+    
+    with pytest.raises(AssertionError):
+        data_quality_library.check_data_completeness(source, target)
+    
+    data_quality_library.check_data_completeness(source, _single_column_table([1000, 2000], pa.duration('ms')))
+
+
+@pytest.mark.unit
+def test_integers_and_timestamps_do_not_collide(data_quality_library):
+    source = _single_column_table([1_000_000], pa.int64())
+    target = _single_column_table([1], pa.timestamp('s'))
+    
+    assert hash_rows(source)[0] != hash_rows(target)[0]
+    with pytest.raises(AssertionError):
+        data_quality_library.check_data_completeness(source, target)
+
+
+@pytest.mark.unit
+def test_time32_columns_are_hashed(data_quality_library):
+    source = _single_column_table([1, 2], pa.time32('s'))
+    
+    data_quality_library.check_data_completeness(source, _single_column_table([2, 1], pa.time32('s')))
+    data_quality_library.check_data_completeness(source, _single_column_table([1_000_000, 2_000_000], pa.time64('us')))
+    with pytest.raises(AssertionError):
+        data_quality_library.check_data_completeness(source, _single_column_table([1, 3], pa.time32('s')))
+
+
+@pytest.mark.unit
+def test_out_of_range_dates_match_timestamps(data_quality_library):
+    dates = [datetime.date(1, 1, 1), datetime.date(9999, 12, 31)]
+    source = _single_column_table(dates, pa.date32())
+    target = _single_column_table([datetime.datetime(d.year, d.month, d.day) for d in dates], pa.timestamp('us'))
+    
+    assert list(hash_rows(source)) == list(hash_rows(target))
@@ -1,6 +1,16 @@
 import pytest
 import pandas as pd
+import hashlib
 import os
+import re
+from functools import lru_cache
+from types import SimpleNamespace
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
 
 
 # Pytest hook to register custom ini option
@@ -15,19 +25,109 @@ def pytest_addoption(parser):
     )
 
 
+# Pytest hook to resolve the CSV file path once per session
+def pytest_configure(config):
+    """
+    Normalize the csv_file_path ini option and store it on the config.
+    Fixtures read it from config._csv_path instead of resolving it again.
+    """
+    path_to_file = config.getini("csv_file_path")
+    config._csv_path = os.path.normpath(path_to_file) if path_to_file else None
+
+
 # Pytest hook to mark unmarked tests with a custom mark
 def pytest_collection_modifyitems(config, items):
     """
     Hook to dynamically mark tests that do not have explicit marks.
     Tests without marks will be assigned to the custom mark 'unmarked'.
     """
+    unmarked_marker = pytest.mark.unmarked
+    
     for item in items:
-        # Get all marks for the test
-        marks = [mark.name for mark in item.iter_markers()]
-        
-        # If the test has no marks (excluding 'unmarked'), add the 'unmarked' mark
-        if not marks or (len(marks) == 1 and 'unmarked' in marks):
-            item.add_marker(pytest.mark.unmarked)
+        # Stop at the first mark other than 'unmarked'; if there is none, add the 'unmarked' mark
+        if not any(mark.name != 'unmarked' for mark in item.iter_markers()):
+            item.add_marker(unmarked_marker)
+
+
+# Explicit dtypes skip type inference; nullable types keep missing and out-of-range values visible to the checks
+_CSV_READ_OPTIONS = {
+    'dtype': {'id': 'Int64', 'name': 'string', 'age': 'Int64', 'email': 'string', 'is_active': 'boolean'},
+    'true_values': ['True', 'true', '1'],
+    'false_values': ['False', 'false', '0'],
+}
+
+
+# Email regex pattern, compiled once for the session
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+
+def _valid_email_mask(emails):
+    """
+    Match every email against the email pattern.
+    
+    Uses Arrow's RE2-based regex kernel when pyarrow is installed, which matches
+    in linear time without backtracking, otherwise pandas' str.match with re.
+    The email column is read with the string dtype, so values are matched as they
+    are and missing emails are reported as invalid.
+    
+    Args:
+        emails: Series of email addresses.
+    
+    Returns:
+        pandas.Series: Boolean mask, True where the email is valid.
+    """
+    if pc is None:
+        return emails.str.match(_EMAIL_RE, na=False)
+    
+    matches = pc.match_substring_regex(pa.array(emails, type=pa.string(), from_pandas=True), _EMAIL_RE.pattern)
+    return pd.Series(pc.fill_null(matches, False).to_numpy(zero_copy_only=False), index=emails.index)
+
+
+# Parse the CSV file once per process, keyed by the normalized path
+@lru_cache(maxsize=1)
+def _read_sample_csv(path, cache_dir=None):
+    """
+    Read the CSV file into a DataFrame.
+    
+    Uses the multi-threaded PyArrow CSV parser when pyarrow is installed,
+    otherwise falls back to the C parser reading from a memory-mapped file.
+    With pyarrow and a cache directory, the parsed content is also stored there
+    as a Parquet file, so other processes such as pytest-xdist workers load it
+    instead of parsing the CSV again. The file name is a hash of the CSV path,
+    size and modification time and of the read options, so any change to the
+    CSV file or to the options parses it again.
+    
+    Args:
+        path: Normalized path to the CSV file.
+        cache_dir: Directory for the parsed Parquet copy, or None to disable it.
+    
+    Returns:
+        pandas.DataFrame: The CSV content as a DataFrame.
+    """
+    if pa is None:
+        return pd.read_csv(path, engine='c', memory_map=True, **_CSV_READ_OPTIONS)
+    
+    if cache_dir is None:
+        return pd.read_csv(path, engine='pyarrow', **_CSV_READ_OPTIONS)
+    
+    csv_stat = os.stat(path)
+    cache_key = repr((os.path.abspath(path), csv_stat.st_size, csv_stat.st_mtime_ns, _CSV_READ_OPTIONS))
+    cache_path = os.path.join(cache_dir, f"{hashlib.blake2b(cache_key.encode()).hexdigest()}.parquet")
+    if os.path.exists(cache_path):
+        return pd.read_parquet(cache_path)
+    
+    df = pd.read_csv(path, engine='pyarrow', **_CSV_READ_OPTIONS)
+    
+    # Write to a temporary file first so that concurrent workers never read a partial file
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # A read-only cache directory only disables the Parquet copy
+        pass
+    
+    return df
 
 
 # Fixture to read the CSV file
@@ -40,27 +140,60 @@ def csv_data(request):
     Returns:
         pandas.DataFrame: The CSV content as a DataFrame.
     """
-    # Read path from pytest.ini
-    path_to_file = request.config.getini("csv_file_path")
+    # Path from pytest.ini, normalized in pytest_configure
+    path_to_file = request.config._csv_path
     
     if not path_to_file:
         pytest.fail("csv_file_path must be specified in pytest.ini")
     
-    # Normalize the path
-    path_to_file = os.path.normpath(path_to_file)
-    
-    # Check if file exists
-    if not os.path.exists(path_to_file):
-        pytest.fail(f"CSV file not found: {path_to_file}")
+    # The parsed copy lives in the pytest cache, which is unavailable with -p no:cacheprovider
+    cache = getattr(request.config, "cache", None)
+    cache_dir = str(cache.mkdir("csv_data")) if cache is not None else None
     
-    # Read the CSV file
+    # Read the CSV file; a missing file is reported by the read itself
     try:
-        df = pd.read_csv(path_to_file)
-        return df
+        # Shallow copy keeps the cached DataFrame isolated from the tests
+        return _read_sample_csv(path_to_file, cache_dir).copy(deep=False)
+    except FileNotFoundError:
+        pytest.fail(f"CSV file not found: {path_to_file}")
     except Exception as e:
         pytest.fail(f"Failed to read CSV file: {e}")
 
 
+# Fixture to look up the is_active flag by id
+@pytest.fixture(scope="session")
+def is_active_by_id(csv_data):
+    """
+    Fixture to index the is_active column by the id column.
+    Only the is_active values are wrapped, the rest of the CSV content is not copied.
+    For duplicated ids the first row is kept, so every lookup returns a single value.
+    
+    Returns:
+        pandas.Series: The is_active values indexed by unique id.
+    """
+    is_active = pd.Series(csv_data['is_active'].array, index=csv_data['id'], name='is_active')
+    return is_active[~is_active.index.duplicated(keep='first')]
+
+
+# Fixture to compute the whole-file checks once per session
+@pytest.fixture(scope="session")
+def csv_checks(csv_data):
+    """
+    Fixture to precompute the results shared by the CSV validation tests.
+    
+    Returns:
+        types.SimpleNamespace: With the attributes
+            cols (tuple): The column names.
+            dup_any (bool): True if the CSV content has duplicate rows.
+            email_mask (pandas.Series): Boolean mask, True where the email is valid.
+    """
+    return SimpleNamespace(
+        cols=tuple(csv_data.columns),
+        dup_any=bool(csv_data.duplicated().any()),
+        email_mask=_valid_email_mask(csv_data['email'])
+    )
+
+
 # Fixture to validate the schema of the file
 @pytest.fixture(scope="session")
 def validate_schema(actual_schema, expected_schema):
@@ -74,4 +207,4 @@ def validate_schema(actual_schema, expected_schema):
     Returns:
         bool: True if schemas match, False otherwise.
     """
-    return list(actual_schema) == list(expected_schema)
+    return pd.Index(actual_schema).equals(pd.Index(expected_schema))